@@ -1,25 +1,34 @@
+import os
 import sys
+import ctypes
 import csv
+import bisect
+import time
 import shutil
+import threading
 from pathlib import Path
-from datetime import datetime
 
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget,
     QLabel, QPushButton, QFileDialog,
-    QComboBox, QListWidget,
+    QComboBox, QListView,
     QTimeEdit, QVBoxLayout, QHBoxLayout,
     QMessageBox, QCheckBox, QSplitter, QSlider
 )
 from PySide6.QtMultimedia import QMediaPlayer, QAudioOutput
 from PySide6.QtMultimediaWidgets import QVideoWidget
-from PySide6.QtCore import QUrl, QTimer, QTime, Qt
+from PySide6.QtCore import (
+    QUrl, QTimer, QTime, Qt, QObject, QRunnable, QThread, QThreadPool, Signal,
+    QStringListModel
+)
 from PySide6.QtGui import QKeySequence, QShortcut
 
 
 CSV_FILE = "time_ranges.csv"
 SEGMENTS_DIR = Path("segments")
 ORDER_FILE = "order.txt"  # per segment folder
+PREFETCH_BYTES = 16 << 20  # 预读下一个视频的字节数
+COPY_CHUNK = 4 << 20       # 后台复制每块大小，块间检查取消标志
 
 
 # =====================
@@ -27,6 +36,9 @@ ORDER_FILE = "order.txt"  # per segment folder
 # =====================
 
 def hhmm_to_min(s: str) -> int:
+    # 常见的 "HH:MM" 直接切片解析；其它写法（如 "9:05"）走通用解析
+    if len(s) == 5 and s[2] == ":":
+        return int(s[:2]) * 60 + int(s[3:])
     h, m = map(int, s.split(":"))
     return h * 60 + m
 
@@ -37,15 +49,180 @@ def qtime_to_min(t: QTime) -> int:
     return t.hour() * 60 + t.minute()
 
 def segment_folder(s: int, e: int) -> str:
-    return f"{min_to_hhmm(s).replace(':','_')}-{min_to_hhmm(e).replace(':','_')}"
+    return f"{s // 60:02d}_{s % 60:02d}-{e // 60:02d}_{e % 60:02d}"
 
-def has_overlap(ranges, new_range):
+def has_overlap(starts, ends, new_range):
+    # starts/ends：按起点升序、互不重叠的非空区间；只需检查插入点两侧
     ns, ne = new_range
-    return any(max(s, ns) < min(e, ne) for s, e in ranges)
+    i = bisect.bisect_right(starts, ns)
+    if i > 0 and max(starts[i - 1], ns) < min(ends[i - 1], ne):
+        return True
+    return i < len(starts) and max(starts[i], ns) < min(ends[i], ne)
+
+# 本地时区偏移（秒）缓存；每 15 分钟（UTC 对齐）重新获取一次，覆盖夏令时切换
+_TZ_REFRESH_S = 900
+_tz_off = 0
+_tz_off_until = 0.0
+
+def _utc_offset(t: float) -> int:
+    global _tz_off, _tz_off_until
+    if t >= _tz_off_until:
+        _tz_off = time.localtime(t).tm_gmtoff
+        _tz_off_until = (t // _TZ_REFRESH_S + 1) * _TZ_REFRESH_S
+    return _tz_off
+
+def now_day_ms() -> int:
+    t = time.time()
+    return (int(t * 1000) + _utc_offset(t) * 1000) % 86_400_000
 
 def now_minutes() -> int:
-    n = datetime.now()
-    return n.hour * 60 + n.minute
+    return now_day_ms() // 60_000
+
+
+# =====================
+# 文件工具
+# =====================
+
+def is_mp4_entry(e: os.DirEntry) -> bool:
+    # normcase：Windows 下与 glob 一样不区分大小写
+    return e.is_file() and os.path.normcase(e.name).endswith(".mp4")
+
+def scan_segment_dir(d: Path) -> tuple[set[str], list[Path]]:
+    """返回 (mp4 文件名集合, 复制临时文件 *.part 列表)"""
+    names: set[str] = set()
+    parts: list[Path] = []
+    with os.scandir(d) as it:
+        for e in it:
+            if is_mp4_entry(e):
+                names.add(sys.intern(e.name))
+            elif e.name.endswith(".part"):
+                parts.append(d / e.name)
+    return names, parts
+
+
+# =====================
+# 可拖动排序的列表模型
+# =====================
+
+class ReorderableListModel(QStringListModel):
+    """只允许放到行与行之间：放到某一行上会覆盖该行文字且不发 rowsMoved"""
+    def flags(self, index):
+        f = super().flags(index)
+        if index.isValid():
+            f &= ~Qt.ItemIsDropEnabled
+        return f
+
+
+# =====================
+# 后台任务（复制 / 预读，避免卡住界面）
+# =====================
+
+class CopySignals(QObject):
+    copied = Signal(object, object)                # (seg, dst)
+    failed = Signal(object, object, object, str)   # (seg, src, dst, error)
+
+
+class CopyTask(QRunnable):
+    def __init__(self, seg: tuple[int, int], src: Path, dst: Path, signals: CopySignals,
+                 cancel: threading.Event):
+        super().__init__()
+        self.seg = seg
+        self.src = src
+        self.dst = dst
+        self.signals = signals
+        self.cancel = cancel
+
+    def run(self):
+        # 先复制到 .part 再改名，复制过程中不会被当成 .mp4 扫到
+        # 分块复制，退出程序时可在块间取消；取消后不再发信号（主窗口可能已销毁）
+        tmp = self.dst.with_name(self.dst.name + ".part")
+        try:
+            with open(self.src, "rb", buffering=0) as fin, open(tmp, "wb", buffering=0) as fout:
+                self._copy_chunks(fin, fout)
+            if not self.cancel.is_set():
+                os.replace(tmp, self.dst)
+        except OSError as e:
+            self._remove_tmp(tmp)
+            if not self.cancel.is_set():
+                self.signals.failed.emit(self.seg, self.src, self.dst, str(e))
+            return
+        if self.cancel.is_set():
+            self._remove_tmp(tmp)
+            return
+        self.signals.copied.emit(self.seg, self.dst)
+
+    def _copy_chunks(self, fin, fout):
+        # Linux 上优先 copy_file_range / sendfile，数据不经过用户态；
+        # 二者都使用并推进文件当前偏移，出错时可从当前位置改用 readinto 继续
+        in_fd, out_fd = fin.fileno(), fout.fileno()
+        kernel_copies = []
+        if hasattr(os, "copy_file_range"):
+            kernel_copies.append(lambda: os.copy_file_range(in_fd, out_fd, COPY_CHUNK))
+        if sys.platform.startswith("linux"):
+            kernel_copies.append(lambda: os.sendfile(out_fd, in_fd, None, COPY_CHUNK))
+        for copy_chunk in kernel_copies:
+            try:
+                while not self.cancel.is_set():
+                    if copy_chunk() == 0:
+                        return
+                return
+            except OSError:
+                # 不支持（跨文件系统、ENOSYS 等）；真正的读写错误会在下一种方式里再次抛出
+                continue
+
+        # 通用方式：复用同一块缓冲区，不为每块分配新的 bytes
+        buf = bytearray(COPY_CHUNK)
+        view = memoryview(buf)
+        while not self.cancel.is_set():
+            n = fin.readinto(buf)
+            if not n:
+                return
+            mv = view[:n]
+            while mv:
+                mv = mv[fout.write(mv):]
+
+    @staticmethod
+    def _remove_tmp(tmp: Path):
+        try:
+            tmp.unlink(missing_ok=True)
+        except OSError:
+            pass
+
+
+class PrefetchTask(QRunnable):
+    """把下一个视频的开头读进系统页缓存，减少切换时打开/探测的延迟"""
+    def __init__(self, path: str):
+        super().__init__()
+        self.path = path
+
+    def run(self):
+        try:
+            fd = os.open(self.path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+        except OSError:
+            return
+        try:
+            if hasattr(os, "posix_fadvise"):
+                os.posix_fadvise(fd, 0, PREFETCH_BYTES, os.POSIX_FADV_WILLNEED)
+            else:
+                # Windows/macOS 没有 fadvise，直接读一遍
+                remaining = PREFETCH_BYTES
+                while remaining > 0 and (chunk := os.read(fd, min(remaining, 1 << 20))):
+                    remaining -= len(chunk)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+# 预读单独一个线程，不会排在全局线程池里的大文件复制后面
+_prefetch_pool: QThreadPool | None = None
+
+def prefetch_file(path: str):
+    global _prefetch_pool
+    if _prefetch_pool is None:
+        _prefetch_pool = QThreadPool()
+        _prefetch_pool.setMaxThreadCount(1)
+    _prefetch_pool.start(PrefetchTask(path))
 
 
 # =====================
@@ -58,16 +235,20 @@ class OnDemandWindow(QMainWindow):
       - terminated=False: 播完自然结束
       - terminated=True : 用户点击“结束点播”中断结束
     """
-    def __init__(self, on_finish, get_volume_0_100, get_muted):
+    def __init__(self, on_finish, get_volume_f, get_muted):
         super().__init__()
         self.setWindowTitle("点播")
         self.resize(1000, 700)
 
         self.on_finish = on_finish
-        self.get_volume_0_100 = get_volume_0_100
+        self.get_volume_f = get_volume_f
         self.get_muted = get_muted
+        # 已写入 audio 的状态，只在变化时重新写入
+        self._applied_vol_f: float | None = None
+        self._applied_muted: bool | None = None
 
-        self.playlist: list[Path] = []
+        # (所在目录, 文件名)，与列表模型逐行对应；目录字符串 intern 后同目录共享
+        self.playlist_items: list[tuple[str, str]] = []
         self.index = 0
 
         self.player = QMediaPlayer(self)
@@ -81,8 +262,12 @@ class OnDemandWindow(QMainWindow):
         self.apply_volume_state()
 
         # 右侧控制区
-        self.list_view = QListWidget()
-        self.list_view.setDragDropMode(QListWidget.InternalMove)
+        self.list_model = ReorderableListModel(self)
+        self.list_model.rowsMoved.connect(self._on_rows_moved)
+        self.list_view = QListView()
+        self.list_view.setModel(self.list_model)
+        self.list_view.setEditTriggers(QListView.NoEditTriggers)
+        self.list_view.setDragDropMode(QListView.InternalMove)
         self.list_view.setDefaultDropAction(Qt.MoveAction)
 
         add_btn = QPushButton("添加视频")
@@ -124,16 +309,16 @@ class OnDemandWindow(QMainWindow):
         self.setCentralWidget(self.splitter)
 
     def apply_volume_state(self):
-        muted = bool(self.get_muted())
-        vol = int(self.get_volume_0_100())
-        self.audio.setMuted(muted)
-        if not muted:
-            self.audio.setVolume(max(0.0, min(1.0, vol / 100.0)))
+        self.set_volume_from_main(self.get_volume_f(), self.get_muted())
 
-    def set_volume_from_main(self, vol_0_100: int, muted: bool):
-        self.audio.setMuted(bool(muted))
-        if not muted:
-            self.audio.setVolume(max(0.0, min(1.0, int(vol_0_100) / 100.0)))
+    def set_volume_from_main(self, vol_f: float, muted: bool):
+        # vol_f 由主窗口归一化到 0.0~1.0
+        if muted != self._applied_muted:
+            self.audio.setMuted(muted)
+            self._applied_muted = muted
+        if vol_f != self._applied_vol_f:
+            self.audio.setVolume(vol_f)
+            self._applied_vol_f = vol_f
 
     def toggle_pause(self):
         st = self.player.playbackState()
@@ -145,28 +330,31 @@ class OnDemandWindow(QMainWindow):
 
     def add_video(self):
         paths, _ = QFileDialog.getOpenFileNames(self, "选择视频", "", "Video (*.mp4 *.mkv *.avi)")
-        for p in paths:
-            fp = Path(p)
-            self.playlist.append(fp)
-            self.list_view.addItem(fp.name)
+        if not paths:
+            return
+        added = [(sys.intern(d), n) for d, n in map(os.path.split, paths)]
+        self.playlist_items.extend(added)
+        self.list_model.setStringList(self.list_model.stringList() + [n for _, n in added])
+
+    def _on_rows_moved(self, parent, start, end, dest, row):
+        # 与模型做同样的行移动，保持 playlist_items 与列表一一对应
+        block = self.playlist_items[start:end + 1]
+        del self.playlist_items[start:end + 1]
+        if row > end:
+            row -= end - start + 1
+        self.playlist_items[row:row] = block
 
     def delete_selected(self):
-        r = self.list_view.currentRow()
+        r = self.list_view.currentIndex().row()
         if r < 0:
             return
-        self.list_view.takeItem(r)
-        del self.playlist[r]
-        if self.index >= len(self.playlist):
-            self.index = max(0, len(self.playlist) - 1)
+        self.list_model.removeRow(r)
+        del self.playlist_items[r]
+        if self.index >= len(self.playlist_items):
+            self.index = max(0, len(self.playlist_items) - 1)
 
     def start_play(self):
-        if self.list_view.count() == 0:
-            return
-
-        order = [self.list_view.item(i).text() for i in range(self.list_view.count())]
-        name_to_path = {p.name: p for p in self.playlist}
-        self.playlist = [name_to_path[n] for n in order if n in name_to_path]
-        if not self.playlist:
+        if not self.playlist_items:
             return
 
         self.index = 0
@@ -175,14 +363,16 @@ class OnDemandWindow(QMainWindow):
 
     def play_current(self):
         self.apply_volume_state()
-        self.player.setSource(QUrl.fromLocalFile(str(self.playlist[self.index])))
+        self.player.setSource(QUrl.fromLocalFile(os.path.join(*self.playlist_items[self.index])))
         self.player.play()
+        if self.index + 1 < len(self.playlist_items):
+            prefetch_file(os.path.join(*self.playlist_items[self.index + 1]))
 
     def on_status(self, status):
         if status != QMediaPlayer.EndOfMedia:
             return
         self.index += 1
-        if self.index >= len(self.playlist):
+        if self.index >= len(self.playlist_items):
             self.close()
             self.on_finish(False)
         else:
@@ -226,18 +416,45 @@ class MainWindow(QMainWindow):
         # ===== 音量状态（主控，0~100）=====
         self.volume = 50
         self.muted = False
+        self._vol_f = self.volume / 100.0  # 归一化音量，volume 变化时更新
+        self._applied_vol_f: float | None = None
+        self._applied_muted: bool | None = None
 
         # ===== 调度/播放状态 =====
         self.time_ranges: list[tuple[int, int]] = []
+        # 所有时间段起止分钟（去重升序），用于定位下一个切换点
+        self._boundaries: list[int] = []
+        # 非空时间段的起/止（按起点升序），用于二分查找
+        self._starts: list[int] = []
+        self._ends: list[int] = []
+        # 手工编辑的 CSV 可能含重叠时间段，此时二分不成立，退回逐个扫描
+        self._ranges_overlap = False
         self.running = False
         self.current_segment: tuple[int, int] | None = None
-        self.current_playlist: list[Path] = []
+        # 当前播放列表：所在目录 + 文件名（同一时间段的视频都在同一目录）
+        self._cur_dir: Path | None = None
+        self._cur_names: list[str] = []
         self.current_index = 0
         self.waiting_next_segment: tuple[int, int] | None = None
 
+        # 目录/文件列表缓存（视频或时间段增删时失效）
+        self._seg_dir_cache: dict[tuple[int, int], Path] = {}
+        self._seg_files_cache: dict[tuple[int, int], list[str]] = {}
+        self._seg_has_video: dict[tuple[int, int], bool] = {}
+        # 各时间段 order.txt 的当前内容，内容不变时跳过写盘
+        self._order_cache: dict[tuple[int, int], str] = {}
+        self._order_save_pending = False
+
+        # 后台复制状态
+        self._copy_signals = CopySignals(self)
+        self._copy_signals.copied.connect(self._on_video_copied)
+        self._copy_signals.failed.connect(self._on_video_copy_failed)
+        self._copying: set[Path] = set()
+        self._copy_cancel = threading.Event()
+
         # 点播中断状态
         self.in_interrupt = False
-        # (segment, playlist, index, position_ms, waiting_next_segment)
+        # (segment, dir, names, index, position_ms, waiting_next_segment)
         self.interrupt_state = None
         self.ondemand_window: OnDemandWindow | None = None
 
@@ -252,9 +469,11 @@ class MainWindow(QMainWindow):
         self.apply_volume_to_main_audio()
         self.player.mediaStatusChanged.connect(self.on_media_status)
 
-        # ===== 定时器：真实时间检测 =====
+        # ===== 定时器：单次触发，定到下一个时间段边界 =====
         self.clock_timer = QTimer(self)
-        self.clock_timer.timeout.connect(self.check_real_time)
+        self.clock_timer.setSingleShot(True)
+        self.clock_timer.setTimerType(Qt.PreciseTimer)
+        self.clock_timer.timeout.connect(self._on_boundary)
 
         # ===== UI：时间段输入 =====
         self.start_t = QTimeEdit(QTime(0, 0))
@@ -266,12 +485,13 @@ class MainWindow(QMainWindow):
         self.segment_box = QComboBox()
         self.segment_box.currentIndexChanged.connect(self.refresh_playlist_view)
 
-        self.playlist_view = QListWidget()
-        self.playlist_view.setDragDropMode(QListWidget.InternalMove)
+        self.playlist_model = ReorderableListModel(self)
+        self.playlist_model.rowsMoved.connect(self._schedule_save_ui_order)
+        self.playlist_view = QListView()
+        self.playlist_view.setModel(self.playlist_model)
+        self.playlist_view.setEditTriggers(QListView.NoEditTriggers)
+        self.playlist_view.setDragDropMode(QListView.InternalMove)
         self.playlist_view.setDefaultDropAction(Qt.MoveAction)
-        self.playlist_view.model().rowsMoved.connect(
-            lambda *args: self.save_ui_order_for_selected_segment()
-        )
 
         # ===== UI：切换策略 =====
         self.graceful_switch_box = QCheckBox("播放完整视频后再切换")
@@ -352,6 +572,10 @@ class MainWindow(QMainWindow):
         row3.addWidget(del_vid_btn)
         left_layout.addLayout(row3)
 
+        self.copy_label = QLabel()
+        self.copy_label.hide()
+        left_layout.addWidget(self.copy_label)
+
         left_layout.addWidget(self.graceful_switch_box)
 
         vol_row = QHBoxLayout()
@@ -404,15 +628,23 @@ class MainWindow(QMainWindow):
     # =====================
 
     def apply_volume_to_main_audio(self):
-        self.audio.setMuted(self.muted)
-        if not self.muted:
-            self.audio.setVolume(max(0.0, min(1.0, self.volume / 100.0)))
+        # 只在变化时写入 audio，避免无效的音频重配置
+        if self.muted != self._applied_muted:
+            self.audio.setMuted(self.muted)
+            self._applied_muted = self.muted
+        if self._vol_f != self._applied_vol_f:
+            self.audio.setVolume(self._vol_f)
+            self._applied_vol_f = self._vol_f
 
     def set_volume(self, v: int):
-        self.volume = max(0, min(100, int(v)))
+        v = max(0, min(100, int(v)))
+        if v == self.volume:
+            return
+        self.volume = v
+        self._vol_f = v / 100.0
         self.apply_volume_to_main_audio()
         if self.ondemand_window is not None:
-            self.ondemand_window.set_volume_from_main(self.volume, self.muted)
+            self.ondemand_window.set_volume_from_main(self._vol_f, self.muted)
 
     def adjust_volume(self, delta: int):
         self.volume_slider.setValue(max(0, min(100, self.volume + delta)))
@@ -421,7 +653,7 @@ class MainWindow(QMainWindow):
         self.muted = not self.muted
         self.apply_volume_to_main_audio()
         if self.ondemand_window is not None:
-            self.ondemand_window.set_volume_from_main(self.volume, self.muted)
+            self.ondemand_window.set_volume_from_main(self._vol_f, self.muted)
 
     # =====================
     # CSV & 时间段列表
@@ -432,21 +664,21 @@ class MainWindow(QMainWindow):
         if not Path(CSV_FILE).exists():
             return
         with open(CSV_FILE, newline="", encoding="utf-8") as f:
-            for r in csv.DictReader(f):
+            rd = csv.reader(f)
+            next(rd, None)  # 跳过表头 start,end
+            for r in rd:
                 try:
-                    s = hhmm_to_min(r["start"])
-                    e = hhmm_to_min(r["end"])
-                    self.time_ranges.append((s, e))
+                    self.time_ranges.append((hhmm_to_min(r[0]), hhmm_to_min(r[1])))
                 except Exception:
                     pass
         self.time_ranges.sort()
+        self._rebuild_index()
 
     def save_csv(self):
         with open(CSV_FILE, "w", newline="", encoding="utf-8") as f:
-            w = csv.DictWriter(f, fieldnames=["start", "end"])
-            w.writeheader()
-            for s, e in self.time_ranges:
-                w.writerow({"start": min_to_hhmm(s), "end": min_to_hhmm(e)})
+            w = csv.writer(f)
+            w.writerow(["start", "end"])
+            w.writerows((min_to_hhmm(s), min_to_hhmm(e)) for s, e in self.time_ranges)
 
     def refresh_segments(self):
         self.segment_box.clear()
@@ -458,34 +690,70 @@ class MainWindow(QMainWindow):
     # =====================
 
     def segment_dir(self, seg: tuple[int, int]) -> Path:
-        return SEGMENTS_DIR / segment_folder(seg[0], seg[1])
+        d = self._seg_dir_cache.get(seg)
+        if d is None:
+            d = self._seg_dir_cache[seg] = SEGMENTS_DIR / segment_folder(seg[0], seg[1])
+        return d
 
     def order_path(self, seg: tuple[int, int]) -> Path:
         return self.segment_dir(seg) / ORDER_FILE
 
     def write_order(self, seg: tuple[int, int], names: list[str]):
+        content = "\n".join(names) + ("\n" if names else "")
+        if self._order_cache.get(seg) == content:
+            return
+        # 先写临时文件再替换，避免写到一半留下残缺的 order.txt
         p = self.order_path(seg)
-        p.write_text("\n".join(names) + ("\n" if names else ""), encoding="utf-8")
+        tmp = p.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            f.write(content)
+        os.replace(tmp, p)
+        self._order_cache[seg] = content
+
+    def invalidate_segment_cache(self, seg: tuple[int, int]):
+        self._seg_files_cache.pop(seg, None)
+        self._seg_has_video.pop(seg, None)
+
+    def load_ordered_files(self, seg: tuple[int, int]) -> list[str]:
+        cached = self._seg_files_cache.get(seg)
+        if cached is not None:
+            return list(cached)
 
-    def load_ordered_files(self, seg: tuple[int, int]) -> list[Path]:
         d = self.segment_dir(seg)
         d.mkdir(exist_ok=True)
 
-        files = {p.name: p for p in d.glob("*.mp4")}
+        try:
+            files, parts = scan_segment_dir(d)
+        except OSError:
+            # 与原先 glob 一样：目录无法读取时当作空
+            files, parts = set(), []
+        # 清理上次中断（如进程被杀）遗留的 .part；正在复制的不动
+        for tmp in parts:
+            if tmp.with_name(tmp.name[:-len(".part")]) not in self._copying:
+                try:
+                    tmp.unlink()
+                except OSError:
+                    pass
         order_file = self.order_path(seg)
 
-        ordered: list[Path] = []
+        ordered: list[str] = []
         if order_file.exists():
-            names = [line.strip() for line in order_file.read_text(encoding="utf-8").splitlines() if line.strip()]
+            on_disk = order_file.read_text(encoding="utf-8")
+            self._order_cache[seg] = on_disk
+            names = [line.strip() for line in on_disk.splitlines() if line.strip()]
             for n in names:
                 if n in files:
-                    ordered.append(files.pop(n))
+                    files.remove(n)
+                    ordered.append(sys.intern(n))
+        else:
+            self._order_cache.pop(seg, None)
+
+        ordered.extend(sorted(files))
 
-        for n in sorted(files.keys()):
-            ordered.append(files[n])
+        self.write_order(seg, ordered)
 
-        self.write_order(seg, [p.name for p in ordered])
-        return ordered
+        self._seg_files_cache[seg] = ordered
+        return list(ordered)
 
     # =====================
     # UI：选中时间段 & 播放列表
@@ -498,20 +766,29 @@ class MainWindow(QMainWindow):
         return self.time_ranges[idx]
 
     def refresh_playlist_view(self):
-        self.playlist_view.clear()
         seg = self.selected_segment()
         if not seg:
+            self.playlist_model.setStringList([])
+            return
+        self.playlist_model.setStringList(self.load_ordered_files(seg))
+
+    def _schedule_save_ui_order(self, *args):
+        # 一次拖动可能触发多次 rowsMoved，合并为一次写盘
+        if self._order_save_pending:
             return
-        ordered = self.load_ordered_files(seg)
-        for p in ordered:
-            self.playlist_view.addItem(p.name)
+        self._order_save_pending = True
+        QTimer.singleShot(0, self._flush_ui_order)
+
+    def _flush_ui_order(self):
+        self._order_save_pending = False
+        self.save_ui_order_for_selected_segment()
 
     def save_ui_order_for_selected_segment(self):
         seg = self.selected_segment()
         if not seg:
             return
-        names = [self.playlist_view.item(i).text() for i in range(self.playlist_view.count())]
-        self.write_order(seg, names)
+        self.write_order(seg, self.playlist_model.stringList())
+        self.invalidate_segment_cache(seg)
 
     # =====================
     # 时间段 CRUD
@@ -524,20 +801,24 @@ class MainWindow(QMainWindow):
         if e < s:
             QMessageBox.warning(self, "非法时间", "结束时间不能早于开始时间")
             return
-        if has_overlap(self.time_ranges, (s, e)):
+        if self.overlaps_existing((s, e)):
             QMessageBox.warning(self, "时间冲突", "时间段重叠")
             return
 
         seg = (s, e)
         self.time_ranges.append(seg)
         self.time_ranges.sort()
+        self._rebuild_index()
 
         d = self.segment_dir(seg)
         d.mkdir(parents=True, exist_ok=True)
         self.write_order(seg, [])
+        self.invalidate_segment_cache(seg)
 
         self.save_csv()
         self.refresh_segments()
+        if self.running:
+            self._on_boundary()
 
     def delete_segment(self):
         seg = self.selected_segment()
@@ -547,16 +828,23 @@ class MainWindow(QMainWindow):
         if self.current_segment == seg:
             self.player.stop()
             self.current_segment = None
-            self.current_playlist = []
+            self._cur_dir = None
+            self._cur_names = []
             self.current_index = 0
             self.waiting_next_segment = None
 
         self.time_ranges.remove(seg)
+        self._rebuild_index()
         shutil.rmtree(self.segment_dir(seg), ignore_errors=True)
+        self.invalidate_segment_cache(seg)
+        self._seg_dir_cache.pop(seg, None)
+        self._order_cache.pop(seg, None)
 
         self.save_csv()
         self.refresh_segments()
-        self.playlist_view.clear()
+        self.playlist_model.setStringList([])
+        if self.running:
+            self._on_boundary()
 
     # =====================
     # 视频 CRUD
@@ -573,41 +861,75 @@ class MainWindow(QMainWindow):
         if not paths:
             return
 
+        # 一次 listdir 得到已有文件名，代替逐个 exists()；normcase 使 Windows 下不区分大小写
+        d.mkdir(parents=True, exist_ok=True)
+        existing = {os.path.normcase(n) for n in os.listdir(d)}
+        pool = QThreadPool.globalInstance()
         for p in paths:
             src = Path(p)
+            key = os.path.normcase(src.name)
             dst = d / src.name
-            if dst.exists():
+            if key in existing or dst in self._copying:
                 continue
-            shutil.copy(src, dst)
+            existing.add(key)
+            self._copying.add(dst)
+            pool.start(CopyTask(seg, src, dst, self._copy_signals, self._copy_cancel))
 
-        self.load_ordered_files(seg)
-        self.refresh_playlist_view()
+        self._update_copy_status()
+
+    def _on_video_copied(self, seg: tuple[int, int], dst: Path):
+        self._copying.discard(dst)
+        self._update_copy_status()
+        self.invalidate_segment_cache(seg)
+        if self.selected_segment() == seg:
+            self.refresh_playlist_view()
+
+    def _on_video_copy_failed(self, seg: tuple[int, int], src: Path, dst: Path, err: str):
+        self._copying.discard(dst)
+        self._update_copy_status()
+        QMessageBox.warning(self, "复制失败", f"{src.name}\n{err}")
+
+    def _update_copy_status(self):
+        n = len(self._copying)
+        self.copy_label.setText(f"正在复制 {n} 个视频…")
+        self.copy_label.setVisible(n > 0)
 
     def delete_video(self):
         seg = self.selected_segment()
         if not seg:
             return
-        r = self.playlist_view.currentRow()
+        r = self.playlist_view.currentIndex().row()
         if r < 0:
             return
 
-        name = self.playlist_view.item(r).text()
+        name = self.playlist_model.index(r).data()
         fp = self.segment_dir(seg) / name
         if fp.exists() and fp.is_file():
             fp.unlink()
+        self.invalidate_segment_cache(seg)
 
-        self.playlist_view.takeItem(r)
+        self.playlist_model.removeRow(r)
         self.save_ui_order_for_selected_segment()
 
     # =====================
     # 运行按钮：不可运行时不变更 bool 和文字
     # =====================
 
+    def _seg_has_mp4(self, seg: tuple[int, int]) -> bool:
+        v = self._seg_has_video.get(seg)
+        if v is not None:
+            return v
+        try:
+            with os.scandir(self.segment_dir(seg)) as it:
+                v = any(is_mp4_entry(e) for e in it)
+        except OSError:
+            # 与原先 glob 一样：目录不存在/无权限等都当作没有视频
+            v = False
+        self._seg_has_video[seg] = v
+        return v
+
     def any_segment_has_video(self) -> bool:
-        for seg in self.time_ranges:
-            if any(self.segment_dir(seg).glob("*.mp4")):
-                return True
-        return False
+        return any(self._seg_has_mp4(seg) for seg in self.time_ranges)
 
     def toggle_run(self):
         if not self.running:
@@ -622,13 +944,13 @@ class MainWindow(QMainWindow):
         self.run_btn.setText("结束运行" if self.running else "开始运行")
 
         if self.running:
-            self.clock_timer.start(1000)
-            self.check_real_time()
+            self._on_boundary()
         else:
             self.clock_timer.stop()
             self.player.stop()
             self.current_segment = None
-            self.current_playlist = []
+            self._cur_dir = None
+            self._cur_names = []
             self.current_index = 0
             self.waiting_next_segment = None
 
@@ -650,17 +972,66 @@ class MainWindow(QMainWindow):
             return
         super().keyPressEvent(e)
 
+    def closeEvent(self, e):
+        # 仍有后台复制时先确认；退出则取消复制并等待线程收尾（会删除 .part）
+        if self._copying:
+            ret = QMessageBox.question(
+                self, "正在复制",
+                f"还有 {len(self._copying)} 个视频正在复制，退出将取消复制。确定退出？"
+            )
+            if ret != QMessageBox.Yes:
+                e.ignore()
+                return
+            self._copy_cancel.set()
+            QThreadPool.globalInstance().waitForDone()
+        super().closeEvent(e)
+
     # =====================
     # 调度：真实时间检测 & 切换策略 & 循环播放
     # =====================
 
+    def overlaps_existing(self, new_range: tuple[int, int]) -> bool:
+        if self._ranges_overlap:
+            ns, ne = new_range
+            return any(max(s, ns) < min(e, ne) for s, e in self.time_ranges)
+        return has_overlap(self._starts, self._ends, new_range)
+
     def find_active_segment(self):
         m = now_minutes()
-        for seg in self.time_ranges:
-            if seg[0] <= m < seg[1]:
-                return seg
+        if self._ranges_overlap:
+            for seg in self.time_ranges:
+                if seg[0] <= m < seg[1]:
+                    return seg
+            return None
+        i = bisect.bisect_right(self._starts, m) - 1
+        if i >= 0 and m < self._ends[i]:
+            return (self._starts[i], self._ends[i])
         return None
 
+    def _rebuild_index(self):
+        self._boundaries = sorted({m for seg in self.time_ranges for m in seg})
+        self._starts = [s for s, e in self.time_ranges if s < e]
+        self._ends = [e for s, e in self.time_ranges if s < e]
+        # 按起点排序后相邻不重叠即全部不重叠
+        self._ranges_overlap = any(self._ends[i] > self._starts[i + 1] for i in range(len(self._starts) - 1))
+
+    def _arm_boundary_timer(self):
+        if not self._boundaries:
+            self.clock_timer.stop()
+            return
+        now = now_day_ms()
+        i = bisect.bisect_right(self._boundaries, now // 60_000)
+        # 今天已无边界 -> 次日第一个边界
+        nxt = self._boundaries[i] if i < len(self._boundaries) else self._boundaries[0] + 1440
+        delay = nxt * 60_000 - now
+        # 最长一分钟兜底（系统休眠/修改系统时间）
+        self.clock_timer.start(max(1, min(delay, 60_000)))
+
+    def _on_boundary(self):
+        self.check_real_time()
+        if self.running:
+            self._arm_boundary_timer()
+
     def check_real_time(self):
         if not self.running or self.in_interrupt:
             return
@@ -679,21 +1050,28 @@ class MainWindow(QMainWindow):
         self.current_segment = seg
         self.waiting_next_segment = None
 
-        self.current_playlist = self.load_ordered_files(seg)
+        self._cur_dir = self.segment_dir(seg)
+        self._cur_names = self.load_ordered_files(seg)
         self.current_index = 0
 
-        if not self.current_playlist:
+        if not self._cur_names:
             return
 
         self.enter_fullscreen()
         self.play_current()
 
+    def current_file(self, i: int) -> str:
+        return str(self._cur_dir / self._cur_names[i])
+
     def play_current(self):
-        if not self.current_playlist:
+        if not self._cur_names:
             return
         self.apply_volume_to_main_audio()
-        self.player.setSource(QUrl.fromLocalFile(str(self.current_playlist[self.current_index])))
+        self.player.setSource(QUrl.fromLocalFile(self.current_file(self.current_index)))
         self.player.play()
+        # 循环播放：预读下一个（列表末尾时为第一个）
+        if len(self._cur_names) > 1:
+            prefetch_file(self.current_file((self.current_index + 1) % len(self._cur_names)))
 
     def on_media_status(self, status):
         if status != QMediaPlayer.EndOfMedia:
@@ -705,8 +1083,8 @@ class MainWindow(QMainWindow):
             self.start_segment(self.waiting_next_segment)
             return
 
-        if self.current_playlist:
-            self.current_index = (self.current_index + 1) % len(self.current_playlist)
+        if self._cur_names:
+            self.current_index = (self.current_index + 1) % len(self._cur_names)
             self.play_current()
 
     # =====================
@@ -718,18 +1096,19 @@ class MainWindow(QMainWindow):
             return
 
         seg = self.current_segment
-        plist = list(self.current_playlist)
+        cur_dir = self._cur_dir
+        names = list(self._cur_names)
         idx = self.current_index
         pos = self.player.position()
         wnext = self.waiting_next_segment
-        self.interrupt_state = (seg, plist, idx, pos, wnext)
+        self.interrupt_state = (seg, cur_dir, names, idx, pos, wnext)
 
         self.in_interrupt = True
         self.player.stop()
 
         self.ondemand_window = OnDemandWindow(
             on_finish=self.resume_from_interrupt,
-            get_volume_0_100=lambda: self.volume,
+            get_volume_f=lambda: self._vol_f,
             get_muted=lambda: self.muted
         )
         self.ondemand_window.show()
@@ -745,26 +1124,28 @@ class MainWindow(QMainWindow):
             self.check_real_time()
             return
 
-        seg, plist, idx, pos, wnext = self.interrupt_state
+        seg, cur_dir, names, idx, pos, wnext = self.interrupt_state
         self.interrupt_state = None
 
         active = self.find_active_segment()
 
-        if seg and active == seg and plist:
+        if seg and active == seg and names:
             self.current_segment = seg
-            self.current_playlist = plist
-            self.current_index = min(idx, len(plist) - 1)
+            self._cur_dir = cur_dir
+            self._cur_names = names
+            self.current_index = min(idx, len(names) - 1)
             self.waiting_next_segment = wnext
 
             self.enter_fullscreen()
             self.apply_volume_to_main_audio()
-            self.player.setSource(QUrl.fromLocalFile(str(self.current_playlist[self.current_index])))
+            self.player.setSource(QUrl.fromLocalFile(self.current_file(self.current_index)))
             self.player.setPosition(pos)
             self.player.play()
             return
 
         self.current_segment = None
-        self.current_playlist = []
+        self._cur_dir = None
+        self._cur_names = []
         self.current_index = 0
         self.waiting_next_segment = None
         self.check_real_time()
@@ -776,6 +1157,13 @@ class MainWindow(QMainWindow):
 
 if __name__ == "__main__":
     app = QApplication(sys.argv)
+
+    # 时间段切换要准点：Windows 下把系统定时器精度提到 1ms（退出时恢复），并提高主线程优先级
+    if sys.platform == "win32":
+        ctypes.windll.winmm.timeBeginPeriod(1)
+        app.aboutToQuit.connect(lambda: ctypes.windll.winmm.timeEndPeriod(1))
+    QThread.currentThread().setPriority(QThread.HighPriority)
+
     w = MainWindow()
     w.show()
     sys.exit(app.exec())